@@ -6,7 +6,9 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import eccodes
 import numpy as np
@@ -14,45 +16,89 @@ from grib import decode_grib, encode_grib
 
 from thermofeel.thermofeel import calculate_cos_solar_zenith_angle
 
+logger = logging.getLogger(__name__)
 
-def calc_cossza(message):
-
-    lats = message["lats"]
-    lons = message["lons"]
-    assert lats.size == lons.size
 
-    print(lats.size)
+def compute_cossza(lats, lons, dt, shape):
+    # only arrays and metadata, so it can run in a worker process
 
-    dt = message["forecast_datetime"]
+    # single precision is ample for cossza and halves the memory traffic of the computation
+    lats = lats.astype(np.float32)
+    lons = lons.astype(np.float32)
+    assert lats.size == lons.size
 
-    print(dt.year, dt.month, dt.day, dt.hour)
+    logger.debug("points %s", lats.size)
 
-    shape = (message["Nj"], message["Ni"])
+    logger.debug("datetime %s %s %s %s", dt.year, dt.month, dt.day, dt.hour)
 
     # vectorised computation
     cossza = calculate_cos_solar_zenith_angle(
         lat=lats, lon=lons, y=dt.year, m=dt.month, d=dt.day, h=dt.hour
     )
-    valsmat = np.reshape(cossza, shape)
+    # reshape to a view on the result, never a copy
+    assert cossza.flags.c_contiguous
+    cossza = cossza.reshape(shape)
 
-    print(valsmat)
+    logger.debug("cossza %s", cossza)
 
+    return cossza
+
+
+def cossza_message(message, cossza):
     new_msg = message.copy()
-    new_msg["values"] = valsmat
+    new_msg["values"] = cossza
     new_msg["paramId"] = "214001"  # cossza from GRIB database
     new_msg["shortName"] = "cossza"  # cossza from GRIB database
 
     return new_msg
 
 
+def calc_cossza(message):
+    shape = (message["Nj"], message["Ni"])
+    cossza = compute_cossza(
+        message["lats"], message["lons"], message["forecast_datetime"], shape
+    )
+    return cossza_message(message, cossza)
+
+
+def init_worker():
+    # the process pool already uses every core, one numba thread per worker avoids oversubscription
+    try:
+        import numba
+
+        numba.set_num_threads(1)
+    except ImportError:
+        pass
+
+
 def main():
+    # usage: cossza.py input.grib output.grib [--verbose]
+    logging.basicConfig(
+        level=logging.DEBUG if "--verbose" in sys.argv[3:] else logging.WARNING
+    )
+
     fout = open(sys.argv[2], "wb")
     try:
         msgs = decode_grib(sys.argv[1], keep=True)
-        print(msgs)
-        for m in msgs:
-            n = calc_cossza(m)
-            encode_grib(n, fout)
+        logger.debug("messages %s", msgs)
+
+        # messages are computed in parallel worker processes, the eccodes handles stay in this
+        # process where a single thread encodes and writes the results in message order
+        with ProcessPoolExecutor(initializer=init_worker) as pool:
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                results = pool.map(
+                    compute_cossza,
+                    [m["lats"] for m in msgs],
+                    [m["lons"] for m in msgs],
+                    [m["forecast_datetime"] for m in msgs],
+                    [(m["Nj"], m["Ni"]) for m in msgs],
+                )
+                writes = [
+                    writer.submit(encode_grib, cossza_message(m, cossza), fout)
+                    for m, cossza in zip(msgs, results)
+                ]
+        for w in writes:
+            w.result()  # re-raise errors from the writer
 
     except eccodes.CodesInternalError as err:
         if eccodes.VERBOSE:
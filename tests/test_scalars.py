@@ -53,6 +53,46 @@ class TestThermalCalculator(unittest.TestCase):
         # print(f"mrt {mrt}")
         assert mrt == pytest.approx(262.81089323, abs=1e-5)
 
+    def test_mean_radiant_temperature_fallback_without_fdir(self):
+        # without direct radiation cossza is not used, numba kernel and numpy fallback agree
+        ssrd = np.array([60000.0, 60000.0, 60000.0, 60000.0]) / 3600
+        ssr = np.array([471818.0, 471818.0, 471818.0, 471818.0]) / 3600
+        fdir = np.array([0.0, 0.0, 0.0, 374150.0]) / 3600
+        strd = np.array([1061213.0, 1061213.0, 1061213.0, 1061213.0]) / 3600
+        strr = np.array([-182697.0, -182697.0, -182697.0, -182697.0]) / 3600
+        cossza = np.array([np.nan, 1.5, 0.4, 0.4])
+        with np.errstate(invalid="ignore"):  # arcsin of the out of range cossza
+            mrt = tmf.calculate_mean_radiant_temperature(
+                ssrd, ssr, fdir, strd, strr, cossza
+            )
+            fallback = np.empty_like(mrt)
+            tmf.thermofeel._mrt_numpy(ssrd, ssr, fdir, strd, strr, cossza, fallback)
+        assert np.all(np.isfinite(mrt))
+        np.testing.assert_allclose(mrt, fallback, rtol=1e-12)
+        assert mrt[0] == mrt[1] == mrt[2]
+
+    def test_readonly_inputs(self):
+        # e.g. memory mapped or buffer backed arrays, passed to the kernels without a copy
+        def readonly(*values):
+            a = np.array(values, dtype=np.float64)
+            a.flags.writeable = False
+            return a
+
+        mrt = tmf.calculate_mean_radiant_temperature(
+            readonly(60000 / 3600),
+            readonly(471818 / 3600),
+            readonly(374150 / 3600),
+            readonly(1061213 / 3600),
+            readonly(-182697 / 3600),
+            readonly(0.4 / 3600),
+        )
+        assert mrt == pytest.approx(262.81089323, abs=1e-5)
+
+        utci = tmf.calculate_utci(
+            readonly(309.0), readonly(3.0), readonly(310.0), readonly(12.0)
+        )
+        assert utci == pytest.approx(34.61530078, abs=1e-5)
+
     def test_utci(self):
         t2mk = np.array([309.0])
         va = np.array([3])
@@ -130,6 +170,9 @@ class TestThermalCalculator(unittest.TestCase):
         assert bgt[1] == pytest.approx(25.78402849, abs=1e-6)
         assert bgt[2] == pytest.approx(25.78400875, abs=1e-6)
 
+        # plain python scalars are accepted
+        assert tmf.calculate_bgt(300, 20, 310) == pytest.approx(bgt[1], abs=1e-6)
+
     def test_wbgt(self):
         t_k = np.array([300])
         td_k = np.array([290])
@@ -154,22 +197,33 @@ class TestThermalCalculator(unittest.TestCase):
         assert wbtdj == pytest.approx(45.114, abs=1e-3)
 
     def test_calculate_cos_solar_zenith_angle(self):
-        # should return ~ 0.360303587797559
+        # should return ~ 0.3618402870131858
         cossza = tmf.calculate_cos_solar_zenith_angle(
             lat=48.81667, lon=2.28972, d=15, m=11, y=2006, h=10.58333
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.360303587797559, abs=1e-6)
+        assert cossza == pytest.approx(0.3618402870131858, abs=1e-6)
 
-        # London, ~ 0.8799471697555967
+        # London, ~ 0.8788699467902442
         cossza = tmf.calculate_cos_solar_zenith_angle(
             lat=51.0, lon=0.0, d=4, m=6, y=2021, h=12.0
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.8799471697555967, abs=1e-6)
+        assert cossza == pytest.approx(0.8788699467902442, abs=1e-6)
         # from alternative formula
         assert cossza == pytest.approx(cos(radians(90.0 - 61.5)), abs=1e-2)
 
+        # float months are accepted, months outside 1..12 are rejected
+        cossza = tmf.calculate_cos_solar_zenith_angle(
+            lat=51.0, lon=0.0, d=4, m=6.0, y=2021, h=12.0
+        )
+        assert cossza == pytest.approx(0.8788699467902442, abs=1e-6)
+        for m in (0, 13):
+            with pytest.raises(ValueError):
+                tmf.calculate_cos_solar_zenith_angle(
+                    lat=51.0, lon=0.0, d=4, m=m, y=2021, h=12.0
+                )
+
     def test_calculate_cos_solar_zenith_angle_integrated(self):
         lat = 48.81667
         lon = 2.28972
@@ -183,7 +237,7 @@ class TestThermalCalculator(unittest.TestCase):
             lat, lon, y, m, d, h, tbegin, tend
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.3612630470539099, abs=1e-6)
+        assert cossza == pytest.approx(0.3627208733779126, abs=1e-6)
 
         # opposite point in the world should be dark
         lat = -lat
@@ -201,7 +255,7 @@ class TestThermalCalculator(unittest.TestCase):
             lat, lon, y, m, d, h, tbegin, tend
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.3612630470539099, abs=1e-6)
+        assert cossza == pytest.approx(0.3627208733779126, abs=1e-6)
 
         lat = 48.81667
         lon = 2.28972
@@ -211,28 +265,105 @@ class TestThermalCalculator(unittest.TestCase):
             lat, lon, y, m, d, h, tbegin, tend, intervals_per_hour=3
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.3612630469576353, abs=1e-7)
+        assert cossza == pytest.approx(0.3627208732815876, abs=1e-7)
 
         # gauss integration order 2
         cossza = tmf.calculate_cos_solar_zenith_angle_integrated(
             lat, lon, y, m, d, h, tbegin, tend, integration_order=2
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.3612623904213413, abs=1e-7)
+        assert cossza == pytest.approx(0.36272021640516905, abs=1e-7)
 
         # gauss integration order 1
         cossza = tmf.calculate_cos_solar_zenith_angle_integrated(
             lat, lon, y, m, d, h, tbegin, tend, integration_order=1
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.36298755581259323, abs=1e-6)
+        assert cossza == pytest.approx(0.3644462647625722, abs=1e-6)
 
         # gauss integration order 4
         cossza = tmf.calculate_cos_solar_zenith_angle_integrated(
             lat, lon, y, m, d, h, tbegin, tend, integration_order=4
         )
         # print(f"cossza {cossza}")
-        assert cossza == pytest.approx(0.36126304695749595, abs=1e-7)
+        assert cossza == pytest.approx(0.36272087328144814, abs=1e-7)
+
+    def test_calculate_cos_solar_zenith_angle_integrated_grid_axes(self):
+        lat = np.array([-60.0, 0.0, 48.81667])
+        lon = np.array([0.0, 2.28972, 90.0, 270.0])
+        latmat, lonmat = np.meshgrid(lat, lon, indexing="ij")
+
+        # lat/lon as broadcastable grid axes give the same result as the full grid
+        cossza = tmf.calculate_cos_solar_zenith_angle_integrated(
+            lat[:, None], lon[None, :], 2006, 11, 15, 10.58333, 0, 3
+        )
+        expected = tmf.calculate_cos_solar_zenith_angle_integrated(
+            latmat, lonmat, 2006, 11, 15, 10.58333, 0, 3
+        )
+        assert cossza.shape == (3, 4)
+        np.testing.assert_array_almost_equal(cossza, expected, 12)
+        assert cossza[2, 1] == pytest.approx(0.3627208733779126, abs=1e-6)
+
+    def test_calculate_cos_solar_zenith_angle_hours_axis(self):
+        lat = np.array([-60.0, 0.0, 48.81667])
+        lon = np.array([0.0, 2.28972, 270.0])
+        hours = np.array([6.0, 10.58333, 18.5])
+
+        # a column of hours evaluates all times over the points at once
+        cossza = tmf.calculate_cos_solar_zenith_angle(
+            lat=lat, lon=lon, y=2006, m=11, d=15, h=hours[:, None]
+        )
+        assert cossza.shape == (3, 3)
+        for n, h in enumerate(hours):
+            expected = tmf.calculate_cos_solar_zenith_angle(
+                lat=lat, lon=lon, y=2006, m=11, d=15, h=h
+            )
+            np.testing.assert_array_almost_equal(cossza[n], expected, 12)
+
+    def test_calculate_cos_solar_zenith_angle_integrated_float32(self):
+        lat = np.array([-89.99, -60.0, 0.0, 48.81667, 89.99])
+        lon = np.array([0.0, 90.0, 2.28972, 2.28972, 270.0])
+
+        # float32 grids are computed and returned in single precision
+        cossza = tmf.calculate_cos_solar_zenith_angle_integrated(
+            lat.astype(np.float32), lon.astype(np.float32), 2006, 11, 15, 10.58333, 0, 3
+        )
+        expected = tmf.calculate_cos_solar_zenith_angle_integrated(
+            lat, lon, 2006, 11, 15, 10.58333, 0, 3
+        )
+        assert cossza.dtype == np.float32
+        np.testing.assert_allclose(cossza, expected, atol=1e-6)
+
+    def test_calculate_cos_solar_zenith_angle_readonly_grid(self):
+        lat = np.array([-60.0, 0.0, 48.81667])
+        lon = np.array([0.0, 2.28972, 270.0])
+
+        # read-only grids (e.g. memory mapped) reach the kernel without a copy
+        for dtype in (np.float64, np.float32):
+            rolat, rolon = lat.astype(dtype), lon.astype(dtype)
+            rolat.flags.writeable = False
+            rolon.flags.writeable = False
+
+            cossza = tmf.calculate_cos_solar_zenith_angle(
+                lat=rolat, lon=rolon, y=2006, m=11, d=15, h=10.58333
+            )
+            expected = tmf.calculate_cos_solar_zenith_angle(
+                lat=lat.astype(dtype),
+                lon=lon.astype(dtype),
+                y=2006,
+                m=11,
+                d=15,
+                h=10.58333,
+            )
+            np.testing.assert_array_equal(cossza, expected)
+
+            cossza = tmf.calculate_cos_solar_zenith_angle_integrated(
+                rolat, rolon, 2006, 11, 15, 10.58333, 0, 3
+            )
+            expected = tmf.calculate_cos_solar_zenith_angle_integrated(
+                lat.astype(dtype), lon.astype(dtype), 2006, 11, 15, 10.58333, 0, 3
+            )
+            np.testing.assert_array_equal(cossza, expected)
 
     def test_solar_declination_angle(self):
         sda, tc = tmf.solar_declination_angle(jd=166, h=0)
@@ -247,6 +378,17 @@ class TestThermalCalculator(unittest.TestCase):
         assert sda == pytest.approx(11.471993171760428, abs=1e-6)
         assert tc == pytest.approx(-0.7161824119549858, abs=1e-6)
 
+        # arrays of days and hours
+        sda, tc = tmf.solar_declination_angle(
+            jd=np.array([166, 4, 600]), h=np.array([0, 12, 3])
+        )
+        assert sda == pytest.approx(
+            [23.32607701732299, -22.64240042915207, 11.471993171760428], abs=1e-6
+        )
+        assert tc == pytest.approx(
+            [-0.054061457069008334, -1.219397058249299, -0.7161824119549858], abs=1e-6
+        )
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
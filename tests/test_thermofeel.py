@@ -95,6 +95,16 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("utci.csv", utci)
         self.assert_equal(self.utci, utci)
 
+    def test_utci_polynomial_fallback(self):
+        # numpy fallback of the (optionally numba compiled) utci kernel against the reference
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        ehPa = tmf.calculate_saturation_vapour_pressure(self.t2m) * rh_pc / 100.0
+        t2m = tmf.kelvin_to_celsius(self.t2m)
+        e_mrt = tmf.kelvin_to_celsius(self.mrt) - t2m
+        utci = np.empty_like(t2m)
+        tmf.thermofeel._utci_horner(t2m, self.va, e_mrt, ehPa / 10.0, utci)
+        self.assert_equal(self.utci, utci)
+
     def test_apparent_temperature(self):
         at = tmf.calculate_apparent_temperature(self.t2m, self.va)
         # np.savetxt("at.csv", at)
@@ -11,7 +11,20 @@ import math
 import os
 import time
 
+# numba is only imported when it may be used, THERMOFEEL_NO_NUMBA keeps it out of the process
+if os.environ.get("THERMOFEEL_NO_NUMBA"):
+    prange = range
+else:
+    try:
+        from numba import prange
+    except ImportError:
+        prange = range
+
 to_radians = math.pi / 180
+to_degrees = 180 / math.pi
+ln10 = math.log(10)
+# [W m-2 K-4] as used in the mean radiant temperature formulation
+stefan_boltzmann = 5.67e-8
 
 func_timers = {}
 
@@ -41,7 +54,18 @@ def timer(func):
 optnumba_jit_functions = {}
 
 
-def optnumba_jit(_func=None, *, nopython=True, nogil=True, parallel=True):
+def optnumba_jit(
+    _func=None,
+    *,
+    nopython=True,
+    nogil=True,
+    parallel=True,
+    fastmath=False,
+    cache=False,
+    fallback=None,
+):
+    # cache: store the compiled code on disk (in __pycache__) so later processes skip the compilation
+    # fallback: pure python/numpy function used instead of func when numba is not used
     def decorator_optnumba(func):
         @functools.wraps(func)
         def jited_function(*args, **kwargs):
@@ -52,23 +76,28 @@ def optnumba_jit(_func=None, *, nopython=True, nogil=True, parallel=True):
                 return optnumba_jit_functions[func](*args, **kwargs)
 
             if os.environ.get("THERMOFEEL_NO_NUMBA"):
-                optnumba_jit_functions[func] = func
+                optnumba_jit_functions[func] = fallback or func
             else:
                 try:
                     import numba
 
                     print(
-                        f"Numba trying to compile {func}, args: nopython {nopython} nogil {nogil} parallel {parallel}"
+                        f"Numba trying to compile {func}, args: nopython {nopython} nogil {nogil} parallel {parallel} "
+                        f"fastmath {fastmath} cache {cache}"
                     )
                     optnumba_jit_functions[func] = numba.jit(
-                        nopython=nopython, nogil=nogil, parallel=parallel
+                        nopython=nopython,
+                        nogil=nogil,
+                        parallel=parallel,
+                        fastmath=fastmath,
+                        cache=cache,
                     )(func)
 
                 except Exception as e:
                     print(
                         f"Numba compilation failed for {func}, reverting to pure python code -- Exception caught: {e}"
                     )
-                    optnumba_jit_functions[func] = func
+                    optnumba_jit_functions[func] = fallback or func
 
             assert (
                 func in optnumba_jit_functions
@@ -37,32 +37,51 @@ import math
 import numpy as np
 
 from .helpers import to_julian_date  # noqa
-from .helpers import func_timers, kPa_to_hPa, optnumba_jit, timer, to_radians  # noqa
+from .helpers import (  # noqa
+    func_timers,
+    kPa_to_hPa,
+    ln10,
+    optnumba_jit,
+    prange,
+    stefan_boltzmann,
+    timer,
+    to_degrees,
+    to_radians,
+)
+
+# days before the start of each month in a non-leap year
+_MONTH_CUM_DAYS = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334])
 
 
 # solar declination angle [degrees] + time correction for solar angle
 def solar_declination_angle(jd, h):
     g = (360 / 365.25) * (jd + (h / 24))  # fractional year g in degrees
-    while g > 360:
-        g = g - 360
+    g = g % 360  # also valid for arrays of g
     grad = g * to_radians
+    # multiple angles from a single sin/cos pair
+    sing = np.sin(grad)
+    cosg = np.cos(grad)
+    sin2g = 2 * sing * cosg
+    cos2g = 1 - 2 * sing * sing
+    sin3g = sing * (3 - 4 * sing * sing)
+    cos3g = cosg * (4 * cosg * cosg - 3)
     # declination in [degrees]
     d = (
         0.396372
-        - 22.91327 * math.cos(grad)
-        + 4.025430 * math.sin(grad)
-        - 0.387205 * math.cos(2 * grad)
-        + 0.051967 * math.sin(2 * grad)
-        - 0.154527 * math.cos(3 * grad)
-        + 0.084798 * math.sin(3 * grad)
+        - 22.91327 * cosg
+        + 4.025430 * sing
+        - 0.387205 * cos2g
+        + 0.051967 * sin2g
+        - 0.154527 * cos3g
+        + 0.084798 * sin3g
     )
     # time correction in [ h.degrees ]
     tc = (
         0.004297
-        + 0.107029 * math.cos(grad)
-        - 1.837877 * math.sin(grad)
-        - 0.837378 * math.cos(2 * grad)
-        - 2.340475 * math.sin(2 * grad)
+        + 0.107029 * cosg
+        - 1.837877 * sing
+        - 0.837378 * cos2g
+        - 2.340475 * sin2g
     )
     return d, tc
 
@@ -80,11 +99,10 @@ def calculate_relative_humidity_percent(t2k, tdk):
     t2c = t2k - 273.15
     tdc = tdk - 273.15
 
-    # saturated vapour pressure
-    es = 6.11 * 10.0 ** (7.5 * t2c / (237.3 + t2c))
-    # vapour pressure
-    e = 6.11 * 10.0 ** (7.5 * tdc / (237.3 + tdc))
-    rh = (e / es) * 100
+    # ratio of vapour pressure e = 6.11 * 10 ** (7.5 * tdc / (237.3 + tdc))
+    # to saturated vapour pressure es = 6.11 * 10 ** (7.5 * t2c / (237.3 + t2c))
+    # as a single exponential, 10 ** x = exp(ln(10) * x)
+    rh = np.exp(ln10 * 7.5 * (tdc / (237.3 + tdc) - t2c / (237.3 + t2c))) * 100
     return rh
 
 
@@ -107,16 +125,96 @@ def calculate_saturation_vapour_pressure(tk):
         -1.8680009e-13,
         2.7150305,
     ]
-    ess = g[7] * np.log(tk)
-    for i in range(7):
-        ess += g[i] * np.power(tk, (i - 2))
+    # sum of g[i] * tk ** (i - 2) with explicit powers, no pow calls
+    inv_tk = 1.0 / tk
+    ess = (
+        g[7] * np.log(tk)
+        + inv_tk * (g[1] + g[0] * inv_tk)
+        + g[2]
+        + tk * (g[3] + tk * (g[4] + tk * (g[5] + tk * g[6])))
+    )
 
     ess = np.exp(ess) * 0.01  # hPa
 
     return ess
 
 
-@optnumba_jit(parallel=False)  # function does not have benefit from parallel execution
+def _cossza_numpy(sindec, cosdec, sha, lat, lon, out):
+    # numpy version of _cossza_kernel, inputs broadcast against each other into out
+    sinlat = np.sin(lat * to_radians, dtype=np.float64)
+    coslat = np.sqrt((1 - sinlat) * (1 + sinlat))  # cos(lat) >= 0 for lat in [-90, 90]
+    np.multiply(cosdec * coslat, np.cos((sha + lon) * to_radians), out=out)
+    out += sindec * sinlat
+
+
+@optnumba_jit(
+    cache=True,
+    fastmath=True,
+    fallback=_cossza_numpy,
+)
+def _cossza_kernel(sindec, cosdec, sha, lat, lon, out):
+    # sindec, cosdec and sha are (times, 1) columns, out is (times, points)
+    # the hour angle is evaluated in the precision of the inputs, the latitude terms always
+    # in double precision as cos(lat) from sin(lat) loses accuracy near the poles otherwise
+    rad = lat.dtype.type(to_radians)
+    for i in prange(lat.size):
+        # cos(lat) from sin(lat), one square root instead of a second trigonometric call
+        sinlat = math.sin(lat[i] * to_radians)
+        coslat = math.sqrt((1 - sinlat) * (1 + sinlat))
+        # the latitude terms are shared by all times
+        for n in range(sha.shape[0]):
+            cossha = math.cos((sha[n, 0] + lon[i]) * rad)
+            out[n, i] = sindec[n, 0] * sinlat + cosdec[n, 0] * coslat * cossha
+
+
+def _cossza_dtype(lat, lon):
+    # float32 lat/lon grids are computed and returned in single precision, anything else in double
+    return np.float32 if np.result_type(lat, lon, 1.0) == np.float32 else np.float64
+
+
+def _solar_geometry(h, y, m, d):
+    # sin and cos of the declination and the solar hour angle without the longitude [h.deg]
+    # at hours h of a day, they do not depend on the location
+
+    m = int(m)
+    if not 1 <= m <= 12:
+        raise ValueError(f"Invalid month {m}, expected 1 to 12")
+
+    # day of the year, leap days counted after February
+    jd = _MONTH_CUM_DAYS[m - 1] + d
+    if m > 2 and ((y % 4 == 0 and y % 100 != 0) or y % 400 == 0):
+        jd += 1
+
+    # declination angle + time correction for solar angle
+    dec, tc = solar_declination_angle(jd, h)
+    drad = dec * to_radians
+
+    return np.sin(drad), np.cos(drad), (h - 12) * 15 + tc
+
+
+def _cossza_from_geometry(sindec, cosdec, sha, lat, lon):
+    # cosine of the solar zenith angle at lat/lon for the given solar geometry, not clipped
+    dtype = _cossza_dtype(lat, lon)
+
+    ntimes = np.size(sha)
+    times_axis = (ntimes,) + (1,) * np.ndim(lat)
+    if np.shape(lat) == np.shape(lon) and np.shape(sha) in ((), times_axis):
+        # one or more times (in a leading axis) over points: fused per point kernel
+        shape = np.broadcast(sha, lat).shape
+        _, (lat, lon) = _flatten_arrays(lat, lon, dtype=dtype)
+        sindec, cosdec, sha = [
+            np.reshape(a, (ntimes, 1)).astype(dtype) for a in (sindec, cosdec, sha)
+        ]
+        out = np.empty((ntimes, lat.size), dtype=dtype)
+        _cossza_kernel(sindec, cosdec, sha, lat, lon, out)
+        return out.reshape(shape)[()]
+
+    # broadcast inputs, e.g. grid axes, keep the trigonometry per axis
+    out = np.empty(np.broadcast(sha, lat, lon).shape, dtype=dtype)
+    _cossza_numpy(sindec, cosdec, sha, lat, lon, out)
+    return out[()]
+
+
 def calculate_cos_solar_zenith_angle_allvalues(h, lat, lon, y, m, d):
     """
     calculate solar zenith angle
@@ -127,6 +225,8 @@ def calculate_cos_solar_zenith_angle_allvalues(h, lat, lon, y, m, d):
     :param d: day [int]
     :param h: hour [int]
 
+    lat and lon may be broadcastable grid axes, see calculate_cos_solar_zenith_angle
+
     https://agupubs.onlinelibrary.wiley.com/doi/epdf/10.1002/2015GL066868
 
     see also:
@@ -134,67 +234,9 @@ def calculate_cos_solar_zenith_angle_allvalues(h, lat, lon, y, m, d):
 
     returns cosine of the solar zenith angle (all values, including negatives)
     """
-
-    # convert to julian days counting from the beginning of the year
-    # jd_ = to_julian_date(d, m, y)  # julian date of data
-    jd_ = (
-        d
-        - 32075
-        + 1461 * (y + 4800 + (m - 14) / 12) / 4
-        + 367 * (m - 2 - (m - 14) / 12 * 12) / 12
-        - 3 * ((y + 4900 + (m - 14) / 12) / 100) / 4
-    )
-
-    # jd11_ = to_julian_date(1, 1, y)  # julian date 1st Jan
-    jd11_ = (
-        1
-        - 32075
-        + 1461 * (y + 4800 + (1 - 14) / 12) / 4
-        + 367 * (1 - 2 - (1 - 14) / 12 * 12) / 12
-        - 3 * ((y + 4900 + (1 - 14) / 12) / 100) / 4
-    )
-
-    jd = jd_ - jd11_ + 1  # days since start of year
-
-    # declination angle + time correction for solar angle
-    # d, tc = solar_declination_angle(jd, h)
-
-    g = (360 / 365.25) * (jd + (h / 24))  # fractional year g in degrees
-    while g > 360:
-        g = g - 360
-    grad = g * to_radians
-    # declination in [degrees]
-    d = (
-        0.396372
-        - 22.91327 * math.cos(grad)
-        + 4.025430 * math.sin(grad)
-        - 0.387205 * math.cos(2 * grad)
-        + 0.051967 * math.sin(2 * grad)
-        - 0.154527 * math.cos(3 * grad)
-        + 0.084798 * math.sin(3 * grad)
-    )
-    # time correction in [ h.degrees ]
-    tc = (
-        0.004297
-        + 0.107029 * math.cos(grad)
-        - 1.837877 * math.sin(grad)
-        - 0.837378 * math.cos(2 * grad)
-        - 2.340475 * math.sin(2 * grad)
-    )
-
-    drad = d * to_radians
-
-    latrad = lat * to_radians
-
-    sindec_sinlat = np.sin(drad) * np.sin(latrad)
-    cosdec_coslat = np.cos(drad) * np.cos(latrad)
-
-    # solar hour angle [h.deg]
-    sharad = ((h - 12) * 15 + lon + tc) * to_radians
-    csza = sindec_sinlat + cosdec_coslat * np.cos(sharad)
-
     # we dont clip negative values here
-    return csza
+    sindec, cosdec, sha = _solar_geometry(h, y, m, d)
+    return _cossza_from_geometry(sindec, cosdec, sha, lat, lon)
 
 
 def calculate_cos_solar_zenith_angle(h, lat, lon, y, m, d):
@@ -207,6 +249,10 @@ def calculate_cos_solar_zenith_angle(h, lat, lon, y, m, d):
     :param d: day [int]
     :param h: hour [int]
 
+    lat and lon may be given as broadcastable axes of a regular grid, e.g. lat with shape (Nj, 1)
+    and lon with shape (1, Ni), so that the trigonometry is evaluated per latitude and per longitude
+    only. The result has the broadcast shape (Nj, Ni).
+
     https://agupubs.onlinelibrary.wiley.com/doi/epdf/10.1002/2015GL066868
 
     see also:
@@ -214,9 +260,47 @@ def calculate_cos_solar_zenith_angle(h, lat, lon, y, m, d):
 
     returns cosine of the solar zenith angle (all values, including negatives)
     """
-    # we separate the function for clipping the negative values since numba doesn't support clip (yet)
     csza = calculate_cos_solar_zenith_angle_allvalues(h, lat, lon, y, m, d)
-    return np.clip(csza, 0, None)
+    if np.ndim(csza) == 0:
+        return np.maximum(csza, 0)
+    # clip negative values in place, csza is a fresh array
+    return np.maximum(csza, 0, out=csza)
+
+
+# Gauss-Legendre nodes and weights on [-1, 1] per integration order
+_GAUSS_NODES_WEIGHTS = {
+    # fastest, worse accuracy (1 point)
+    1: (np.array([0.0]), np.array([2.0])),
+    # faster, less accurate (2 points)
+    2: (
+        np.array([-1.0 / math.sqrt(3.0), 1.0 / math.sqrt(3.0)]),
+        np.array([1.0, 1.0]),
+    ),
+    # default, good speed and accuracy (3 points)
+    3: (
+        np.array([-math.sqrt(3.0 / 5.0), 0.0, math.sqrt(3.0 / 5.0)]),
+        np.array([5.0 / 9.0, 8.0 / 9.0, 5.0 / 9.0]),
+    ),
+    # slower, more accurate (4 points)
+    4: (
+        np.array(
+            [
+                -math.sqrt(3.0 / 7.0 + 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
+                -math.sqrt(3.0 / 7.0 - 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
+                math.sqrt(3.0 / 7.0 - 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
+                math.sqrt(3.0 / 7.0 + 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
+            ]
+        ),
+        np.array(
+            [
+                (18 - math.sqrt(30)) / 36,
+                (18 + math.sqrt(30)) / 36,
+                (18 + math.sqrt(30)) / 36,
+                (18 - math.sqrt(30)) / 36,
+            ]
+        ),
+    ),
+}
 
 
 def calculate_cos_solar_zenith_angle_integrated(
@@ -235,6 +319,8 @@ def calculate_cos_solar_zenith_angle_integrated(
     :param integration order:  order of gauss integration [int] valid = (1, 2, 3, 4)
     :param intervals_per_hour:  number of time intregrations per hour [int]
 
+    lat and lon may be broadcastable grid axes, see calculate_cos_solar_zenith_angle
+
     https://agupubs.onlinelibrary.wiley.com/doi/epdf/10.1002/2015GL066868
 
     This uses Gaussian numerical integration. See https://en.wikipedia.org/wiki/Gaussian_quadrature
@@ -243,38 +329,10 @@ def calculate_cos_solar_zenith_angle_integrated(
     """
 
     # Gauss-Integration coefficients
-    if integration_order == 3:  # default, good speed and accuracy (3 points)
-        E = np.array([-math.sqrt(3.0 / 5.0), 0.0, math.sqrt(3.0 / 5.0)])
-        W = np.array([5.0 / 9.0, 8.0 / 9.0, 5.0 / 9.0])
-    else:
-        if integration_order == 1:  # fastest, worse accuracy (1 point)
-            E = np.array([0.0])
-            W = np.array([2.0])
-        else:
-            if integration_order == 2:  # faster, less accurate (2 points)
-                E = np.array([-1.0 / math.sqrt(3.0), 1.0 / math.sqrt(3.0)])
-                W = np.array([1.0, 1.0])
-            else:
-                if integration_order == 4:  # slower, more accurate (4 points)
-                    E = np.array(
-                        [
-                            -math.sqrt(3.0 / 7.0 + 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
-                            -math.sqrt(3.0 / 7.0 - 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
-                            math.sqrt(3.0 / 7.0 - 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
-                            math.sqrt(3.0 / 7.0 + 2.0 / 7.0 * math.sqrt(6.0 / 5.0)),
-                        ]
-                    )
-                    W = np.array(
-                        [
-                            (18 - math.sqrt(30)) / 36,
-                            (18 + math.sqrt(30)) / 36,
-                            (18 + math.sqrt(30)) / 36,
-                            (18 - math.sqrt(30)) / 36,
-                        ]
-                    )
-                else:
-                    print("Invalid integration_order %d", integration_order)
-                    raise ValueError
+    if integration_order not in _GAUSS_NODES_WEIGHTS:
+        print("Invalid integration_order %d", integration_order)
+        raise ValueError
+    E, W = _GAUSS_NODES_WEIGHTS[integration_order]
 
     assert intervals_per_hour > 0
 
@@ -284,28 +342,125 @@ def calculate_cos_solar_zenith_angle_integrated(
 
     time_steps = np.linspace(tbegin, tend, num=nsplits + 1)
 
-    integral = np.zeros_like(lat)
-    for s in range(len(time_steps) - 1):
-        ti = time_steps[s]
-        tf = time_steps[s + 1]
+    shape = np.broadcast(lat, lon).shape
+    dtype = _cossza_dtype(lat, lon)
+    integral = np.zeros(shape, dtype=dtype)
+    buf = np.empty(shape, dtype=dtype)
+    buf_1d = buf.reshape(-1)
+
+    # splits have equal length, so the weights (scaled to the average of the integral) are the same
+    # for all of them: jacob / (tend - tbegin) with jacob = (tend - tbegin) / nsplits / 2
+    w = (W * (0.5 / nsplits)).astype(dtype)
+
+    # gauss node times of all splits, one row per split
+    jacob = 0.5 * (tend - tbegin) / nsplits
+    t = 0.5 * (time_steps[:-1] + time_steps[1:])[:, np.newaxis] + jacob * E
+
+    # the solar geometry only depends on time, computed once for all nodes
+    sindec, cosdec, sha = _solar_geometry(h + t, y, m, d)
+
+    # gauss nodes of one split are evaluated together along a leading axis
+    node_axis = (len(E),) + (1,) * len(shape)
+    for s in range(nsplits):
+        cossza = _cossza_from_geometry(
+            sindec[s].reshape(node_axis),
+            cosdec[s].reshape(node_axis),
+            sha[s].reshape(node_axis),
+            lat,
+            lon,
+        )
+        np.maximum(cossza, 0, out=cossza)
+        # weighted sum of the nodes as a matrix-vector product (BLAS gemv) on contiguous 2D/1D views
+        np.dot(w, cossza.reshape(len(E), -1), out=buf_1d)
+        np.add(integral, buf, out=integral)
 
-        deltat = tf - ti
-        jacob = deltat / 2.0
+    return integral
 
-        w = jacob * W
-        w /= tend - tbegin  # average of integral
-        t = jacob * E
-        t += (tf + ti) / 2.0
 
-        for n in range(len(w)):
-            integral += w[n] * calculate_cos_solar_zenith_angle(
-                lat=lat, lon=lon, y=y, m=m, d=d, h=(h + t[n])
+def _flatten_arrays(*arrays, dtype=np.float64):
+    # broadcast inputs against each other and return their shape and contiguous 1D views of dtype
+    arrays = np.broadcast_arrays(*arrays)
+    shape = arrays[0].shape
+    return shape, [np.ascontiguousarray(a, dtype=dtype).ravel() for a in arrays]
+
+
+def _mrt_numpy(ssrd, ssr, fdir, strd, strr, cossza, out):
+    # numpy version of _mrt_kernel, working in-place in out and a single buffer
+    buf = np.empty_like(out)
+
+    # fp projected factor area, from solar angle gamma [degrees]
+    np.arcsin(cossza, out=out)
+    out *= to_degrees
+    np.multiply(out, out, out=buf)
+    buf /= 50000
+    out *= to_radians * 0.998
+    out -= buf
+    np.cos(out, out=out)
+    out *= 0.308
+
+    # direct radiation, filtered for solar zenith angle
+    np.copyto(buf, fdir)
+    np.divide(fdir, cossza, out=buf, where=cossza > 0.01)
+    out *= buf
+    # without direct radiation (e.g. night side) the fp term vanishes, as in _mrt_kernel
+    np.copyto(out, 0.0, where=fdir == 0.0)
+
+    np.subtract(ssrd, fdir, out=buf)  # dsw
+    buf *= 0.5
+    out += buf
+    np.subtract(ssrd, ssr, out=buf)  # rsw
+    buf *= 0.5
+    out += buf
+    out *= 0.7 / 0.97
+
+    np.subtract(strd, strr, out=buf)  # lur
+    buf *= 0.5
+    out += buf
+    np.multiply(strd, 0.5, out=buf)
+    out += buf
+
+    out *= 1 / stefan_boltzmann
+    np.sqrt(out, out=out)
+    np.sqrt(out, out=out)
+
+
+@optnumba_jit(
+    cache=True,
+    fallback=_mrt_numpy,
+)
+def _mrt_kernel(ssrd, ssr, fdir, strd, strr, cossza, out):
+    for i in prange(out.size):
+        dsw = ssrd[i] - fdir[i]
+        rsw = ssrd[i] - ssr[i]
+        lur = strd[i] - strr[i]
+
+        # without direct radiation (e.g. night side) the fp term vanishes, skip its trigonometry
+        fp_fdir = 0.0
+        if fdir[i] != 0.0:
+            # calculate fp projected factor area
+            gamma = math.asin(cossza[i]) * to_degrees
+            fp = 0.308 * math.cos(to_radians * gamma * 0.998 - (gamma * gamma / 50000))
+
+            # filter statement for solar zenith angle
+            fdir_n = fdir[i]
+            if cossza[i] > 0.01:
+                fdir_n = fdir_n / cossza[i]
+
+            fp_fdir = fp * fdir_n
+
+        # fourth root as two square roots, cheaper than pow
+        out[i] = math.sqrt(
+            math.sqrt(
+                (1 / stefan_boltzmann)
+                * (
+                    0.5 * strd[i]
+                    + 0.5 * lur
+                    + (0.7 / 0.97) * (0.5 * dsw + 0.5 * rsw + fp_fdir)
+                )
             )
-
-    return integral
+        )
 
 
-@optnumba_jit
 def calculate_mean_radiant_temperature(ssrd, ssr, fdir, strd, strr, cossza):
     """
     mrt - Mean Radiant Temperature
@@ -319,295 +474,323 @@ def calculate_mean_radiant_temperature(ssrd, ssr, fdir, strd, strr, cossza):
     returns Mean Radiant Temperature [K]
     https://link.springer.com/article/10.1007/s00484-020-01900-5
     """
-    dsw = ssrd - fdir
-    rsw = ssrd - ssr
-    lur = strd - strr
-
-    # calculate fp projected factor area
-
-    gamma = np.arcsin(cossza) * 180 / np.pi
-    fp = 0.308 * np.cos(to_radians * gamma * 0.998 - (gamma * gamma / 50000))
-
-    # filter statement for solar zenith angle
-    csza_filter1 = np.where((cossza > 0.01))
-    # print(csza_filter1)
-    fdir[csza_filter1] = fdir[csza_filter1] / cossza[csza_filter1]
-
-    # calculate mean radiant temperature
-    mrt = np.power(
-        (
-            (1 / 0.0000000567)
-            * (
-                0.5 * strd
-                + 0.5 * lur
-                + (0.7 / 0.97) * (0.5 * dsw + 0.5 * rsw + fp * fdir)
-            )
-        ),
-        0.25,
-    )
-
-    return mrt
+    shape, inputs = _flatten_arrays(ssrd, ssr, fdir, strd, strr, cossza)
+
+    mrt = np.empty(inputs[0].size)
+    _mrt_kernel(*inputs, mrt)
+
+    return mrt.reshape(shape)[()]
+
+
+# UTCI 6th order polynomial as (coefficient, t2m, va, e_mrt, rh) exponents
+_UTCI_TERMS = (
+    (1.0, 1, 0, 0, 0),  # leading t2m of the operational polynomial
+    (6.07562052e-01, 0, 0, 0, 0),
+    (-2.27712343e-02, 1, 0, 0, 0),
+    (8.06470249e-04, 2, 0, 0, 0),
+    (-1.54271372e-04, 3, 0, 0, 0),
+    (-3.24651735e-06, 4, 0, 0, 0),
+    (7.32602852e-08, 5, 0, 0, 0),
+    (1.35959073e-09, 6, 0, 0, 0),
+    (-2.25836520e00, 0, 1, 0, 0),
+    (8.80326035e-02, 1, 1, 0, 0),
+    (2.16844454e-03, 2, 1, 0, 0),
+    (-1.53347087e-05, 3, 1, 0, 0),
+    (-5.72983704e-07, 4, 1, 0, 0),
+    (-2.55090145e-09, 5, 1, 0, 0),
+    (-7.51269505e-01, 0, 2, 0, 0),
+    (-4.08350271e-03, 1, 2, 0, 0),
+    (-5.21670675e-05, 2, 2, 0, 0),
+    (1.94544667e-06, 3, 2, 0, 0),
+    (1.14099531e-08, 4, 2, 0, 0),
+    (1.58137256e-01, 0, 3, 0, 0),
+    (-6.57263143e-05, 1, 3, 0, 0),
+    (2.22697524e-07, 2, 3, 0, 0),
+    (-4.16117031e-08, 3, 3, 0, 0),
+    (-1.27762753e-02, 0, 4, 0, 0),
+    (9.66891875e-06, 1, 4, 0, 0),
+    (2.52785852e-09, 2, 4, 0, 0),
+    (4.56306672e-04, 0, 5, 0, 0),
+    (-1.74202546e-07, 1, 5, 0, 0),
+    (-5.91491269e-06, 0, 6, 0, 0),
+    (3.98374029e-01, 0, 0, 1, 0),
+    (1.83945314e-04, 1, 0, 1, 0),
+    (-1.73754510e-04, 2, 0, 1, 0),
+    (-7.60781159e-07, 3, 0, 1, 0),
+    (3.77830287e-08, 4, 0, 1, 0),
+    (5.43079673e-10, 5, 0, 1, 0),
+    (-2.00518269e-02, 0, 1, 1, 0),
+    (8.92859837e-04, 1, 1, 1, 0),
+    (3.45433048e-06, 2, 1, 1, 0),
+    (-3.77925774e-07, 3, 1, 1, 0),
+    (-1.69699377e-09, 4, 1, 1, 0),
+    (1.69992415e-04, 0, 2, 1, 0),
+    (-4.99204314e-05, 1, 2, 1, 0),
+    (2.47417178e-07, 2, 2, 1, 0),
+    (1.07596466e-08, 3, 2, 1, 0),
+    (8.49242932e-05, 0, 3, 1, 0),
+    (1.35191328e-06, 1, 3, 1, 0),
+    (-6.21531254e-09, 2, 3, 1, 0),
+    (-4.99410301e-06, 0, 4, 1, 0),
+    (-1.89489258e-08, 1, 4, 1, 0),
+    (8.15300114e-08, 0, 5, 1, 0),
+    (7.55043090e-04, 0, 0, 2, 0),
+    (-5.65095215e-05, 1, 0, 2, 0),
+    (-4.52166564e-07, 1, 0, 2, 0),  # kept as t2m * e_mrt2, as in previous releases
+    (2.46688878e-08, 3, 0, 2, 0),
+    (2.42674348e-10, 4, 0, 2, 0),
+    (1.54547250e-04, 0, 1, 2, 0),
+    (5.24110970e-06, 1, 1, 2, 0),
+    (-8.75874982e-08, 2, 1, 2, 0),
+    (-1.50743064e-09, 3, 1, 2, 0),
+    (-1.56236307e-05, 0, 2, 2, 0),
+    (-1.33895614e-07, 1, 2, 2, 0),
+    (2.49709824e-09, 2, 2, 2, 0),
+    (6.51711721e-07, 0, 3, 2, 0),
+    (1.94960053e-09, 1, 3, 2, 0),
+    (-1.00361113e-08, 0, 4, 2, 0),
+    (-1.21206673e-05, 0, 0, 3, 0),
+    (-2.18203660e-07, 1, 0, 3, 0),
+    (7.51269482e-09, 2, 0, 3, 0),
+    (9.79063848e-11, 3, 0, 3, 0),
+    (1.25006734e-06, 0, 1, 3, 0),
+    (-1.81584736e-09, 1, 1, 3, 0),
+    (-3.52197671e-10, 2, 1, 3, 0),
+    (-3.36514630e-08, 0, 2, 3, 0),
+    (1.35908359e-10, 1, 2, 3, 0),
+    (4.17032620e-10, 0, 3, 3, 0),
+    (-1.30369025e-09, 0, 0, 4, 0),
+    (4.13908461e-10, 1, 0, 4, 0),
+    (9.22652254e-12, 2, 0, 4, 0),
+    (-5.08220384e-09, 0, 1, 4, 0),
+    (-2.24730961e-11, 1, 1, 4, 0),
+    (1.17139133e-10, 0, 2, 4, 0),
+    (6.62154879e-10, 0, 0, 5, 0),
+    (4.03863260e-13, 1, 0, 5, 0),
+    (1.95087203e-12, 0, 1, 5, 0),
+    (-4.73602469e-12, 0, 0, 6, 0),
+    (5.12733497e00, 0, 0, 0, 1),
+    (-3.12788561e-01, 1, 0, 0, 1),
+    (-1.96701861e-02, 2, 0, 0, 1),
+    (9.99690870e-04, 3, 0, 0, 1),
+    (9.51738512e-06, 4, 0, 0, 1),
+    (-4.66426341e-07, 5, 0, 0, 1),
+    (5.48050612e-01, 0, 1, 0, 1),
+    (-3.30552823e-03, 1, 1, 0, 1),
+    (-1.64119440e-03, 2, 1, 0, 1),
+    (-5.16670694e-06, 3, 1, 0, 1),
+    (9.52692432e-07, 4, 1, 0, 1),
+    (-4.29223622e-02, 0, 2, 0, 1),
+    (5.00845667e-03, 1, 2, 0, 1),
+    (1.00601257e-06, 2, 2, 0, 1),
+    (-1.81748644e-06, 3, 2, 0, 1),
+    (-1.25813502e-03, 0, 3, 0, 1),
+    (-1.79330391e-04, 1, 3, 0, 1),
+    (2.34994441e-06, 2, 3, 0, 1),
+    (1.29735808e-04, 0, 4, 0, 1),
+    (1.29064870e-06, 1, 4, 0, 1),
+    (-2.28558686e-06, 0, 5, 0, 1),
+    (-3.69476348e-02, 0, 0, 1, 1),
+    (1.62325322e-03, 1, 0, 1, 1),
+    (-3.14279680e-05, 2, 0, 1, 1),
+    (2.59835559e-06, 3, 0, 1, 1),
+    (-4.77136523e-08, 4, 0, 1, 1),
+    (8.64203390e-03, 0, 1, 1, 1),
+    (-6.87405181e-04, 1, 1, 1, 1),
+    (-9.13863872e-06, 2, 1, 1, 1),
+    (5.15916806e-07, 3, 1, 1, 1),
+    (-3.59217476e-05, 0, 2, 1, 1),
+    (3.28696511e-05, 1, 2, 1, 1),
+    (-7.10542454e-07, 2, 2, 1, 1),
+    (-1.24382300e-05, 0, 3, 1, 1),
+    (-7.38584400e-09, 1, 3, 1, 1),
+    (2.20609296e-07, 0, 4, 1, 1),
+    (-7.32469180e-04, 0, 0, 2, 1),
+    (-1.87381964e-05, 1, 0, 2, 1),
+    (4.80925239e-06, 2, 0, 2, 1),
+    (-8.75492040e-08, 3, 0, 2, 1),
+    (2.77862930e-05, 0, 1, 2, 1),
+    (-5.06004592e-06, 1, 1, 2, 1),
+    (1.14325367e-07, 2, 1, 2, 1),
+    (2.53016723e-06, 0, 2, 2, 1),
+    (-1.72857035e-08, 1, 2, 2, 1),
+    (-3.95079398e-08, 0, 3, 2, 1),
+    (-3.59413173e-07, 0, 0, 3, 1),
+    (7.04388046e-07, 1, 0, 3, 1),
+    (-1.89309167e-08, 2, 0, 3, 1),
+    (-4.79768731e-07, 0, 1, 3, 1),
+    (7.96079978e-09, 1, 1, 3, 1),
+    (1.62897058e-09, 0, 2, 3, 1),
+    (3.94367674e-08, 0, 0, 4, 1),
+    (-1.18566247e-09, 1, 0, 4, 1),
+    (3.34678041e-10, 0, 1, 4, 1),
+    (-1.15606447e-10, 0, 0, 5, 1),
+    (-2.80626406e00, 0, 0, 0, 2),
+    (5.48712484e-01, 1, 0, 0, 2),
+    (-3.99428410e-03, 2, 0, 0, 2),
+    (-9.54009191e-04, 3, 0, 0, 2),
+    (1.93090978e-05, 4, 0, 0, 2),
+    (-3.08806365e-01, 0, 1, 0, 2),
+    (1.16952364e-02, 1, 1, 0, 2),
+    (4.95271903e-04, 2, 1, 0, 2),
+    (-1.90710882e-05, 3, 1, 0, 2),
+    (2.10787756e-03, 0, 2, 0, 2),
+    (-6.98445738e-04, 1, 2, 0, 2),
+    (2.30109073e-05, 2, 2, 0, 2),
+    (4.17856590e-04, 0, 3, 0, 2),
+    (-1.27043871e-05, 1, 3, 0, 2),
+    (-3.04620472e-06, 0, 4, 0, 2),
+    (5.14507424e-02, 0, 0, 1, 2),
+    (-4.32510997e-03, 1, 0, 1, 2),
+    (8.99281156e-05, 2, 0, 1, 2),
+    (-7.14663943e-07, 3, 0, 1, 2),
+    (-2.66016305e-04, 0, 1, 1, 2),
+    (2.63789586e-04, 1, 1, 1, 2),
+    (-7.01199003e-06, 2, 1, 1, 2),
+    (-1.06823306e-04, 0, 2, 1, 2),
+    (3.61341136e-06, 1, 2, 1, 2),
+    (2.29748967e-07, 0, 3, 1, 2),
+    (3.04788893e-04, 0, 0, 2, 2),
+    (-6.42070836e-05, 1, 0, 2, 2),
+    (1.16257971e-06, 2, 0, 2, 2),
+    (7.68023384e-06, 0, 1, 2, 2),
+    (-5.47446896e-07, 1, 1, 2, 2),
+    (-3.59937910e-08, 0, 2, 2, 2),
+    (-4.36497725e-06, 0, 0, 3, 2),
+    (1.68737969e-07, 1, 0, 3, 2),
+    (2.67489271e-08, 0, 1, 3, 2),
+    (3.23926897e-09, 0, 0, 4, 2),
+    (-3.53874123e-02, 0, 0, 0, 3),
+    (-2.21201190e-01, 1, 0, 0, 3),
+    (1.55126038e-02, 2, 0, 0, 3),
+    (-2.63917279e-04, 3, 0, 0, 3),
+    (4.53433455e-02, 0, 1, 0, 3),
+    (-4.32943862e-03, 1, 1, 0, 3),
+    (1.45389826e-04, 2, 1, 0, 3),
+    (2.17508610e-04, 0, 2, 0, 3),
+    (-6.66724702e-05, 1, 2, 0, 3),
+    (3.33217140e-05, 0, 3, 0, 3),
+    (-2.26921615e-03, 0, 0, 1, 3),
+    (3.80261982e-04, 1, 0, 1, 3),
+    (-5.45314314e-09, 2, 0, 1, 3),
+    (-7.96355448e-04, 0, 1, 1, 3),
+    (2.53458034e-05, 1, 1, 1, 3),
+    (-6.31223658e-06, 0, 2, 1, 3),
+    (3.02122035e-04, 0, 0, 2, 3),
+    (-4.77403547e-06, 1, 0, 2, 3),
+    (1.73825715e-06, 0, 1, 2, 3),
+    (-4.09087898e-07, 0, 0, 3, 3),
+    (6.14155345e-01, 0, 0, 0, 4),
+    (-6.16755931e-02, 1, 0, 0, 4),
+    (1.33374846e-03, 2, 0, 0, 4),
+    (3.55375387e-03, 0, 1, 0, 4),
+    (-5.13027851e-04, 1, 1, 0, 4),
+    (1.02449757e-04, 0, 2, 0, 4),
+    (-1.48526421e-03, 0, 0, 1, 4),
+    (-4.11469183e-05, 1, 0, 1, 4),
+    (-6.80434415e-06, 0, 1, 1, 4),
+    (-9.77675906e-06, 0, 0, 2, 4),
+    (8.82773108e-02, 0, 0, 0, 5),
+    (-3.01859306e-03, 1, 0, 0, 5),
+    (1.04452989e-03, 0, 1, 0, 5),
+    (2.47090539e-04, 0, 0, 1, 5),
+    (1.48348065e-03, 0, 0, 0, 6),
+)
+
+
+def _utci_coefficients():
+    # coefficient table indexed as [rh, e_mrt, va, t2m] exponents
+    c = np.zeros((7, 7, 7, 7))
+    for coef, i, j, k, r in _UTCI_TERMS:
+        c[r, k, j, i] += coef
+    return c
+
+
+_UTCI_COEFFICIENTS = _utci_coefficients()
+
+
+def _utci_horner(t2m, va, e_mrt, rh, out):
+    # numpy version of _utci_kernel, accumulating in-place into a few buffers
+    c = _UTCI_COEFFICIENTS
+
+    p_emrt = np.empty_like(out)
+    p_va = np.empty_like(out)
+    p_t2m = np.empty_like(out)
+
+    for r in range(6, -1, -1):
+        for k in range(6 - r, -1, -1):
+            for j in range(6 - r - k, -1, -1):
+                n = 6 - r - k - j
+                p_t2m[...] = c[r, k, j, n]
+                for i in range(n - 1, -1, -1):
+                    np.multiply(p_t2m, t2m, p_t2m)
+                    np.add(p_t2m, c[r, k, j, i], p_t2m)
+                if j == 6 - r - k:
+                    p_va[...] = p_t2m
+                else:
+                    np.multiply(p_va, va, p_va)
+                    np.add(p_va, p_t2m, p_va)
+            if k == 6 - r:
+                p_emrt[...] = p_va
+            else:
+                np.multiply(p_emrt, e_mrt, p_emrt)
+                np.add(p_emrt, p_va, p_emrt)
+        if r == 6:
+            out[...] = p_emrt
+        else:
+            np.multiply(out, rh, out)
+            np.add(out, p_emrt, out)
+
+
+@optnumba_jit(
+    cache=True,
+    fastmath=True,
+    fallback=_utci_horner,
+)
+def _utci_kernel(t2m, va, e_mrt, rh, out):
+    # per element nested Horner scheme (rh outermost, then e_mrt, va and t2m innermost)
+    c = _UTCI_COEFFICIENTS
+
+    for idx in prange(out.size):
+        t = t2m[idx]
+        v = va[idx]
+        e = e_mrt[idx]
+        h = rh[idx]
+
+        utci = 0.0
+        for r in range(6, -1, -1):
+            p_emrt = 0.0
+            for k in range(6 - r, -1, -1):
+                p_va = 0.0
+                for j in range(6 - r - k, -1, -1):
+                    p_t2m = 0.0
+                    for i in range(6 - r - k - j, -1, -1):
+                        p_t2m = p_t2m * t + c[r, k, j, i]
+                    p_va = p_va * v + p_t2m
+                p_emrt = p_emrt * e + p_va
+            utci = utci * h + p_emrt
+
+        out[idx] = utci
 
 
-@optnumba_jit
 def calculate_utci_polynomial(t2m, mrt, va, rh):
+    """
+    Evaluate the UTCI polynomial in a single pass over the inputs
+    :param t2m: (float array) 2m temperature [°C]
+    :param mrt: (float array) mean radiant temperature [°C]
+    :param va: (float array) wind speed at 10 meters [m/s]
+    :param rh: (float array) water vapour pressure [kPa]
+
+    returns UTCI [°C]
+    """
+    shape, (t2m, mrt, va, rh) = _flatten_arrays(t2m, mrt, va, rh)
 
     e_mrt = np.subtract(mrt, t2m)
 
-    t2m2 = t2m * t2m
-    t2m3 = t2m2 * t2m
-    t2m4 = t2m3 * t2m
-    t2m5 = t2m4 * t2m
-    t2m6 = t2m5 * t2m
-
-    va2 = va * va
-    va3 = va2 * va
-    va4 = va3 * va
-    va5 = va4 * va
-    va6 = va5 * va
-
-    e_mrt2 = e_mrt * e_mrt
-    e_mrt3 = e_mrt2 * e_mrt
-    e_mrt4 = e_mrt3 * e_mrt
-    e_mrt5 = e_mrt4 * e_mrt
-    e_mrt6 = e_mrt5 * e_mrt
-
-    rh2 = rh * rh
-    rh3 = rh2 * rh
-    rh4 = rh3 * rh
-    rh5 = rh4 * rh
-    rh6 = rh5 * rh
-
-    varh2 = va * rh2
-    va2_rh = va2 * rh
-    va2_e_mrt = va2 * e_mrt
-    e_mrt_rh = e_mrt * rh
-    e_mrt_rh2 = e_mrt * rh2
-    e_mrt2_rh = e_mrt2 * rh
-    e_mrt2_rh2 = e_mrt2 * rh2
-    e_mrt_rh3 = e_mrt * rh3
-    va_e_mrt = va * e_mrt
-    va_e_mrt2 = va * e_mrt2
-    va_rh = va * rh
-    t2m_va = t2m * va
-    e_mrt3_rh = e_mrt3 * rh
-    e_mrt4_rh = e_mrt4 * rh
-
-    utci = (
-        t2m
-        + 6.07562052e-01
-        + -2.27712343e-02 * t2m
-        + 8.06470249e-04 * t2m2
-        + -1.54271372e-04 * t2m3
-        + -3.24651735e-06 * t2m4
-        + 7.32602852e-08 * t2m5
-        + 1.35959073e-09 * t2m6
-        + -2.25836520e00 * va
-        + 8.80326035e-02 * t2m * va
-        + 2.16844454e-03 * t2m2 * va
-        + -1.53347087e-05 * t2m3 * va
-        + -5.72983704e-07 * t2m4 * va
-        + -2.55090145e-09 * t2m5 * va
-        + -7.51269505e-01 * va2
-        + -4.08350271e-03 * t2m * va2
-        + -5.21670675e-05 * t2m2 * va2
-        + 1.94544667e-06 * t2m3 * va2
-        + 1.14099531e-08 * t2m4 * va2
-        + 1.58137256e-01 * va3
-        + -6.57263143e-05 * t2m * va3
-        + 2.22697524e-07 * t2m2 * va3
-        + -4.16117031e-08 * t2m3 * va3
-        + -1.27762753e-02 * va4
-        + 9.66891875e-06 * t2m * va4
-        + 2.52785852e-09 * t2m2 * va4
-        + 4.56306672e-04 * va5
-        + -1.74202546e-07 * t2m * va5
-        + -5.91491269e-06 * va6
-        + 3.98374029e-01 * e_mrt
-        + 1.83945314e-04 * t2m * e_mrt
-        + -1.73754510e-04 * t2m2 * e_mrt
-        + -7.60781159e-07 * t2m3 * e_mrt
-        + 3.77830287e-08 * t2m4 * e_mrt
-        + 5.43079673e-10 * t2m5 * e_mrt
-        + -2.00518269e-02 * va_e_mrt
-        + 8.92859837e-04 * t2m * va_e_mrt
-        + 3.45433048e-06 * t2m2 * va_e_mrt
-        + -3.77925774e-07 * t2m3 * va_e_mrt
-        + -1.69699377e-09 * t2m4 * va_e_mrt
-        + 1.69992415e-04 * va2_e_mrt
-        + -4.99204314e-05 * t2m * va2_e_mrt
-        + 2.47417178e-07 * t2m2 * va2_e_mrt
-        + 1.07596466e-08 * t2m3 * va2_e_mrt
-        + 8.49242932e-05 * va3 * e_mrt
-        + 1.35191328e-06 * t2m * va3 * e_mrt
-        + -6.21531254e-09 * t2m2 * va3 * e_mrt
-        + -4.99410301e-06 * va4 * e_mrt
-        + -1.89489258e-08 * t2m * va4 * e_mrt
-        + 8.15300114e-08 * va5 * e_mrt
-        + 7.55043090e-04 * e_mrt2
-        + -5.65095215e-05 * t2m * e_mrt2
-        + -4.52166564e-07 * t2m * e_mrt2
-        + 2.46688878e-08 * t2m3 * e_mrt2
-        + 2.42674348e-10 * t2m4 * e_mrt2
-        + 1.54547250e-04 * va_e_mrt2
-        + 5.24110970e-06 * t2m * va_e_mrt2
-        + -8.75874982e-08 * t2m2 * va_e_mrt2
-        + -1.50743064e-09 * t2m3 * va_e_mrt2
-        + -1.56236307e-05 * va2 * e_mrt2
-        + -1.33895614e-07 * t2m * va2 * e_mrt2
-        + 2.49709824e-09 * t2m2 * va2 * e_mrt2
-        + 6.51711721e-07 * va3 * e_mrt2
-        + 1.94960053e-09 * t2m * va3 * e_mrt2
-        + -1.00361113e-08 * va4 * e_mrt2
-        + -1.21206673e-05 * e_mrt3
-        + -2.18203660e-07 * t2m * e_mrt3
-        + 7.51269482e-09 * t2m2 * e_mrt3
-        + 9.79063848e-11 * t2m3 * e_mrt3
-        + 1.25006734e-06 * va * e_mrt3
-        + -1.81584736e-09 * t2m_va * e_mrt3
-        + -3.52197671e-10 * t2m2 * va * e_mrt3
-        + -3.36514630e-08 * va2 * e_mrt3
-        + 1.35908359e-10 * t2m * va2 * e_mrt3
-        + 4.17032620e-10 * va3 * e_mrt3
-        + -1.30369025e-09 * e_mrt4
-        + 4.13908461e-10 * t2m * e_mrt4
-        + 9.22652254e-12 * t2m2 * e_mrt4
-        + -5.08220384e-09 * va * e_mrt4
-        + -2.24730961e-11 * t2m_va * e_mrt4
-        + 1.17139133e-10 * va2 * e_mrt4
-        + 6.62154879e-10 * e_mrt5
-        + 4.03863260e-13 * t2m * e_mrt5
-        + 1.95087203e-12 * va * e_mrt5
-        + -4.73602469e-12 * e_mrt6
-        + 5.12733497e00 * rh
-        + -3.12788561e-01 * t2m * rh
-        + -1.96701861e-02 * t2m2 * rh
-        + 9.99690870e-04 * t2m3 * rh
-        + 9.51738512e-06 * t2m4 * rh
-        + -4.66426341e-07 * t2m5 * rh
-        + 5.48050612e-01 * va_rh
-        + -3.30552823e-03 * t2m * va_rh
-        + -1.64119440e-03 * t2m2 * va_rh
-        + -5.16670694e-06 * t2m3 * va_rh
-        + 9.52692432e-07 * t2m4 * va_rh
-        + -4.29223622e-02 * va2_rh
-        + 5.00845667e-03 * t2m * va2_rh
-        + 1.00601257e-06 * t2m2 * va2_rh
-        + -1.81748644e-06 * t2m3 * va2_rh
-        + -1.25813502e-03 * va3 * rh
-        + -1.79330391e-04 * t2m * va3 * rh
-        + 2.34994441e-06 * t2m2 * va3 * rh
-        + 1.29735808e-04 * va4 * rh
-        + 1.29064870e-06 * t2m * va4 * rh
-        + -2.28558686e-06 * va5 * rh
-        + -3.69476348e-02 * e_mrt_rh
-        + 1.62325322e-03 * t2m * e_mrt_rh
-        + -3.14279680e-05 * t2m2 * e_mrt_rh
-        + 2.59835559e-06 * t2m3 * e_mrt_rh
-        + -4.77136523e-08 * t2m4 * e_mrt_rh
-        + 8.64203390e-03 * va * e_mrt_rh
-        + -6.87405181e-04 * t2m_va * e_mrt_rh
-        + -9.13863872e-06 * t2m2 * va * e_mrt_rh
-        + 5.15916806e-07 * t2m3 * va * e_mrt_rh
-        + -3.59217476e-05 * va2 * e_mrt_rh
-        + 3.28696511e-05 * t2m * va2 * e_mrt_rh
-        + -7.10542454e-07 * t2m2 * va2 * e_mrt_rh
-        + -1.24382300e-05 * va3 * e_mrt_rh
-        + -7.38584400e-09 * t2m * va3 * e_mrt_rh
-        + 2.20609296e-07 * va4 * e_mrt_rh
-        + -7.32469180e-04 * e_mrt2_rh
-        + -1.87381964e-05 * t2m * e_mrt2_rh
-        + 4.80925239e-06 * t2m2 * e_mrt2_rh
-        + -8.75492040e-08 * t2m3 * e_mrt2_rh
-        + 2.77862930e-05 * va * e_mrt2_rh
-        + -5.06004592e-06 * t2m_va * e_mrt2_rh
-        + 1.14325367e-07 * t2m2 * va * e_mrt2_rh
-        + 2.53016723e-06 * va2 * e_mrt2_rh
-        + -1.72857035e-08 * t2m * va2 * e_mrt2_rh
-        + -3.95079398e-08 * va3 * e_mrt2_rh
-        + -3.59413173e-07 * e_mrt3_rh
-        + 7.04388046e-07 * t2m * e_mrt3_rh
-        + -1.89309167e-08 * t2m2 * e_mrt3_rh
-        + -4.79768731e-07 * va * e_mrt3_rh
-        + 7.96079978e-09 * t2m_va * e_mrt3_rh
-        + 1.62897058e-09 * va2 * e_mrt3_rh
-        + 3.94367674e-08 * e_mrt4_rh
-        + -1.18566247e-09 * t2m * e_mrt4_rh
-        + 3.34678041e-10 * va * e_mrt4_rh
-        + -1.15606447e-10 * e_mrt5 * rh
-        + -2.80626406e00 * rh2
-        + 5.48712484e-01 * t2m * rh2
-        + -3.99428410e-03 * t2m2 * rh2
-        + -9.54009191e-04 * t2m3 * rh2
-        + 1.93090978e-05 * t2m4 * rh2
-        + -3.08806365e-01 * varh2
-        + 1.16952364e-02 * t2m * varh2
-        + 4.95271903e-04 * t2m2 * varh2
-        + -1.90710882e-05 * t2m3 * varh2
-        + 2.10787756e-03 * va2 * rh2
-        + -6.98445738e-04 * t2m * va2 * rh2
-        + 2.30109073e-05 * t2m2 * va2 * rh2
-        + 4.17856590e-04 * va3 * rh2
-        + -1.27043871e-05 * t2m * va3 * rh2
-        + -3.04620472e-06 * va4 * rh2
-        + 5.14507424e-02 * e_mrt_rh2
-        + -4.32510997e-03 * t2m * e_mrt_rh2
-        + 8.99281156e-05 * t2m2 * e_mrt_rh2
-        + -7.14663943e-07 * t2m3 * e_mrt_rh2
-        + -2.66016305e-04 * va * e_mrt_rh2
-        + 2.63789586e-04 * t2m_va * e_mrt_rh2
-        + -7.01199003e-06 * t2m2 * va * e_mrt_rh2
-        + -1.06823306e-04 * va2 * e_mrt_rh2
-        + 3.61341136e-06 * t2m * va2 * e_mrt_rh2
-        + 2.29748967e-07 * va3 * e_mrt_rh2
-        + 3.04788893e-04 * e_mrt2_rh2
-        + -6.42070836e-05 * t2m * e_mrt2_rh2
-        + 1.16257971e-06 * t2m2 * e_mrt2_rh2
-        + 7.68023384e-06 * va * e_mrt2_rh2
-        + -5.47446896e-07 * t2m_va * e_mrt2_rh2
-        + -3.59937910e-08 * va2 * e_mrt2_rh2
-        + -4.36497725e-06 * e_mrt3 * rh2
-        + 1.68737969e-07 * t2m * e_mrt3 * rh2
-        + 2.67489271e-08 * va * e_mrt3 * rh2
-        + 3.23926897e-09 * e_mrt4 * rh2
-        + -3.53874123e-02 * rh3
-        + -2.21201190e-01 * t2m * rh3
-        + 1.55126038e-02 * t2m2 * rh3
-        + -2.63917279e-04 * t2m3 * rh3
-        + 4.53433455e-02 * va * rh3
-        + -4.32943862e-03 * t2m_va * rh3
-        + 1.45389826e-04 * t2m2 * va * rh3
-        + 2.17508610e-04 * va2 * rh3
-        + -6.66724702e-05 * t2m * va2 * rh3
-        + 3.33217140e-05 * va3 * rh3
-        + -2.26921615e-03 * e_mrt_rh3
-        + 3.80261982e-04 * t2m * e_mrt_rh3
-        + -5.45314314e-09 * t2m2 * e_mrt_rh3
-        + -7.96355448e-04 * va * e_mrt_rh3
-        + 2.53458034e-05 * t2m_va * e_mrt_rh3
-        + -6.31223658e-06 * va2 * e_mrt_rh3
-        + 3.02122035e-04 * e_mrt2 * rh3
-        + -4.77403547e-06 * t2m * e_mrt2 * rh3
-        + 1.73825715e-06 * va * e_mrt2 * rh3
-        + -4.09087898e-07 * e_mrt3 * rh3
-        + 6.14155345e-01 * rh4
-        + -6.16755931e-02 * t2m * rh4
-        + 1.33374846e-03 * t2m2 * rh4
-        + 3.55375387e-03 * va * rh4
-        + -5.13027851e-04 * t2m_va * rh4
-        + 1.02449757e-04 * va2 * rh4
-        + -1.48526421e-03 * e_mrt * rh4
-        + -4.11469183e-05 * t2m * e_mrt * rh4
-        + -6.80434415e-06 * va * e_mrt * rh4
-        + -9.77675906e-06 * e_mrt2 * rh4
-        + 8.82773108e-02 * rh5
-        + -3.01859306e-03 * t2m * rh5
-        + 1.04452989e-03 * va * rh5
-        + 2.47090539e-04 * e_mrt * rh5
-        + 1.48348065e-03 * rh6
-    )
+    utci = np.empty_like(e_mrt)
+    _utci_kernel(t2m, va, e_mrt, rh, utci)
 
-    return utci
+    return utci.reshape(shape)[()]
 
 
 def calculate_utci(t2_k, va_ms, mrt_k, ehPa=None, td_k=None):
@@ -746,25 +929,24 @@ def calculate_bgt(t_k, mrt, va):
 
     https://www.sciencedirect.com/science/article/abs/pii/S0378778817335971?via%3Dihub
     """
+    # accept scalars and sequences, no copy for arrays
+    t_k = np.asarray(t_k)
+    mrt = np.asarray(mrt)
+    va = np.asarray(va)
 
     f = (1.1e8 * va**0.6) / (0.98 * 0.15**0.4)
     a = f / 2
     b = -f * t_k - mrt**4
+    a2 = a * a
     rt1 = 3 ** (1 / 3)
-    rt2 = np.sqrt(3) * np.sqrt(27 * a**4 - 16 * b**3) + 9 * a**2
+    rt2 = np.sqrt(3) * np.sqrt(27 * a2 * a2 - 16 * b * b * b) + 9 * a2
     rt3 = 2 * 2 ** (2 / 3) * b
     a = a.clip(min=0)
-    bgt_quartic = -1 / 2 * np.sqrt(
-        rt3 / (rt1 * rt2 ** (1 / 3)) + (2 ** (1 / 3) * rt2 ** (1 / 3)) / 3 ** (2 / 3)
-    ) + 1 / 2 * np.sqrt(
-        (4 * a)
-        / np.sqrt(
-            rt3 / (rt1 * rt2 ** (1 / 3))
-            + (2 ** (1 / 3) * rt2 ** (1 / 3)) / 3 ** (2 / 3)
-        )
-        - (2 ** (1 / 3) * rt2 ** (1 / 3)) / 3 ** (2 / 3)
-        - rt3 / (rt1 * rt2 ** (1 / 3))
-    )
+    # cube root and the radicand shared by both square roots are computed once
+    rt2_cbrt = np.cbrt(rt2)
+    q = rt3 / (rt1 * rt2_cbrt) + (2 ** (1 / 3) * rt2_cbrt) / 3 ** (2 / 3)
+    sq = np.sqrt(q)
+    bgt_quartic = -1 / 2 * sq + 1 / 2 * np.sqrt((4 * a) / sq - q)
 
     bgt_c = kelvin_to_celsius(bgt_quartic)
     return bgt_c
@@ -810,6 +992,10 @@ def calculate_mrt_from_bgt(t2m, bgt, va):
 
     https://www.sciencedirect.com/science/article/abs/pii/S0378778817335971?via%3Dihub
     """
+    # accept scalars and sequences, no copy for arrays
+    t2m = np.asarray(t2m)
+    bgt = np.asarray(bgt)
+    va = np.asarray(va)
 
     f = (1.1e8 * va**0.6) / (0.98 * 0.15**0.4)
     bgt4 = bgt**4
@@ -818,6 +1004,8 @@ def calculate_mrt_from_bgt(t2m, bgt, va):
     return kelvin_to_celsius(mrtc2)
 
 
+# function does not have benefit from parallel execution
+@optnumba_jit(parallel=False, cache=True)
 def calculate_humidex(t2m, td):
     """
     humidex - heat index used by the Canadian Meteorological Service
@@ -852,6 +1040,10 @@ def calculate_net_effective_temperature(t2m, va, td):
     return net
 
 
+# wind speed reduction from 10m to 2m, ~1.2m height (logarithmic wind profile)
+_WIND_10M_TO_2M = 4.87 / math.log10(67.8 * 10 - 5.42)
+
+
 def calculate_apparent_temperature(t2m, va, rh=None):
     """
     Apparent Temperature version without radiation
@@ -864,7 +1056,7 @@ def calculate_apparent_temperature(t2m, va, rh=None):
     if rh is None:
         rh = calculate_saturation_vapour_pressure(t2m)
 
-    va = va * 4.87 / np.log10(67.8 * 10 - 5.42)  # converting to 2m, ~1.2m wind speed
+    va = va * _WIND_10M_TO_2M  # converting to 2m, ~1.2m wind speed
     at = t2m + 0.33 * rh - 0.7 * va - 4
     at = kelvin_to_celsius(at)
 
@@ -884,7 +1076,8 @@ def calculate_wind_chill(t2m, va):
     """
     tc = t2m - 273.15  # kelvin_to_celsius(tk)
     va = va * 2.23694  # convert to miles per hour
-    windchill = 13.12 + 0.6215 * tc - 11.37 * va**0.16 + 0.3965 + tc + va**0.16
+    va016 = va**0.16
+    windchill = 13.12 + 0.6215 * tc - 11.37 * va016 + 0.3965 + tc + va016
     return windchill
 
 
@@ -919,10 +1112,10 @@ def calculate_heat_index_simplified(t2m, rh=None):
         + hiarray[1] * t2m
         + hiarray[2] * rh
         - hiarray[3] * t2m * rh
-        - hiarray[4] * rh**2
-        + hiarray[5] * t2m**2 * rh
-        + hiarray[6] * t2m * rh**2
-        - hiarray[7] * t2m**2 * rh**2
+        - hiarray[4] * rh * rh
+        + hiarray[5] * t2m * t2m * rh
+        + hiarray[6] * t2m * rh * rh
+        - hiarray[7] * t2m * t2m * rh * rh
     )
 
     return hi
@@ -959,11 +1152,11 @@ def calculate_heat_index_adjusted(t2m, td):
         + hiarray[1] * t2m
         + hiarray[2] * rh
         - hiarray[3] * t2m * rh
-        - hiarray[4] * t2m**2
-        - hiarray[5] * rh**2
-        + hiarray[6] * t2m**2 * rh
-        + hiarray[7] * t2m * rh**2
-        - hiarray[8] * t2m**2 * rh**2
+        - hiarray[4] * t2m * t2m
+        - hiarray[5] * rh * rh
+        + hiarray[6] * t2m * t2m * rh
+        + hiarray[7] * t2m * rh * rh
+        - hiarray[8] * t2m * t2m * rh * rh
     )
 
     hi_filter1 = np.where(t2m > 80)